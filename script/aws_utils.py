@@ -0,0 +1,89 @@
+# script/aws_utils.py
+import functools
+import json
+import os
+import sys
+import time
+
+import boto3
+from botocore.config import Config
+
+# Cached config is considered fresh for this many seconds (0 disables caching)
+SSM_CACHE_MAX_AGE = int(os.environ.get("AGENTIC_PLATFORM_SSM_CACHE_MAX_AGE", "300"))
+# Set to 1 to also keep the config on disk between script runs. The file is keyed
+# only by environment and region, so it must be cleared after switching AWS accounts.
+SSM_DISK_CACHE = os.environ.get("AGENTIC_PLATFORM_SSM_DISK_CACHE", "0") == "1"
+SSM_CACHE_DIR = os.path.expanduser("~/.cache/agentic-platform")
+
+# Shared client settings so every script call reuses pooled keep-alive connections
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=10
+)
+
+@functools.lru_cache(maxsize=None)
+def get_session(region=None):
+    """Return a boto3 session for the region, resolving credentials only once"""
+    return boto3.session.Session(region_name=region)
+
+@functools.lru_cache(maxsize=None)
+def get_client(service, region=None):
+    """Return a cached boto3 client for the service, built from the shared session"""
+    return get_session(region).client(service, config=CLIENT_CONFIG)
+
+def _cache_path(environment, region):
+    """Path of the on-disk cache file for an (environment, region) pair"""
+    return os.path.join(SSM_CACHE_DIR, f"ssm-{environment}-{region or 'default'}.json")
+
+def _read_disk_cache(path, max_age):
+    """Return the cached config if the file is younger than max_age, else None"""
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_disk_cache(path, config):
+    """Persist config to disk; the file mtime marks when it was fetched"""
+    try:
+        os.makedirs(SSM_CACHE_DIR, mode=0o700, exist_ok=True)
+        # The parameter is fetched with decryption, so keep the file private
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f)
+    except OSError as e:
+        print(f"Warning: could not write SSM config cache: {e}")
+
+@functools.lru_cache(maxsize=8)
+def _fetch_config(environment, region):
+    """Fetch configuration from SSM Parameter Store, returning (fetched_at, config)"""
+    ssm = get_client('ssm', region)
+    param_name = f"/agentic-platform/config/{environment}"
+    response = ssm.get_parameter(Name=param_name, WithDecryption=True)
+    return time.monotonic(), json.loads(response['Parameter']['Value'])
+
+def get_config_from_ssm(environment="dev", region=None, max_age=SSM_CACHE_MAX_AGE):
+    """Fetch configuration from SSM Parameter Store, reusing a recent cached copy"""
+    use_disk_cache = SSM_DISK_CACHE and max_age > 0
+    path = _cache_path(environment, region)
+    if use_disk_cache:
+        config = _read_disk_cache(path, max_age)
+        if config is not None:
+            return config
+
+    try:
+        now = time.monotonic()
+        fetched_at, config = _fetch_config(environment, region)
+        if fetched_at < now - max_age:
+            _fetch_config.cache_clear()
+            fetched_at, config = _fetch_config(environment, region)
+    except Exception as e:
+        print(f"Error fetching config from SSM: {e}")
+        sys.exit(1)
+
+    if use_disk_cache:
+        _write_disk_cache(path, config)
+    return config
@@ -1,26 +1,17 @@
 #!/usr/bin/env python3
-import boto3
-import json
 import argparse
 import sys
-import random
-import string
+import secrets
+
+from aws_utils import get_client, get_config_from_ssm
 
 def generate_random_string(length=8):
-    """Generate a random string of letters and digits"""
-    return ''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(length))
+    """Generate a random string of lowercase hex characters"""
+    return secrets.token_hex((length + 1) // 2)[:length]
 
-def get_config_from_ssm(environment="dev", region=None):
-    """Fetch configuration from SSM Parameter Store"""
-    ssm = boto3.client('ssm', region_name=region)
-    param_name = f"/agentic-platform/config/{environment}"
-    
-    try:
-        response = ssm.get_parameter(Name=param_name, WithDecryption=True)
-        return json.loads(response['Parameter']['Value'])
-    except Exception as e:
-        print(f"Error fetching config from SSM: {e}")
-        sys.exit(1)
+def generate_password(length=12):
+    """Generate a cryptographically strong password that satisfies the Cognito policy"""
+    return secrets.token_urlsafe(length)[:length] + "Aa1!"
 
 def create_admin_user(email=None, password=None, environment="dev", region=None):
     """Create user using Cognito admin APIs"""
@@ -32,9 +23,9 @@ def create_admin_user(email=None, password=None, environment="dev", region=None)
         sys.exit(1)
     
     email = email or f"test-{generate_random_string(8)}@example.com"
-    password = password or generate_random_string(12) + "Aa1!"
+    password = password or generate_password(12)
     
-    cognito = boto3.client('cognito-idp', region_name=region)
+    cognito = get_client('cognito-idp', region)
     
     try:
         print(f"Creating user: {email}")
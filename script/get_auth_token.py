@@ -1,21 +1,25 @@
 # get_auth_token.py
-import boto3
 import os
-import json
 import argparse
+import asyncio
 import sys
 
-def get_config_from_ssm(environment="dev", region=None):
-    """Fetch configuration from SSM Parameter Store"""
-    ssm = boto3.client('ssm', region_name=region)
-    param_name = f"/agentic-platform/config/{environment}"
-    
-    try:
-        response = ssm.get_parameter(Name=param_name, WithDecryption=True)
-        return json.loads(response['Parameter']['Value'])
-    except Exception as e:
-        print(f"Error fetching config from SSM: {e}")
-        sys.exit(1)
+from aws_utils import get_client, get_config_from_ssm
+
+# Cognito throttles InitiateAuth per account, so cap in-flight batch requests
+BATCH_CONCURRENCY = 8
+
+def _initiate_auth(client, client_id, username, password):
+    """Authenticate a single user and return the access token"""
+    response = client.initiate_auth(
+        ClientId=client_id,
+        AuthFlow='USER_PASSWORD_AUTH',
+        AuthParameters={
+            'USERNAME': username,
+            'PASSWORD': password
+        }
+    )
+    return response['AuthenticationResult']['AccessToken']
 
 def get_token(username=None, password=None, environment="dev", region=None):
     """Get Cognito access token using provided or SSM credentials"""
@@ -32,20 +36,10 @@ def get_token(username=None, password=None, environment="dev", region=None):
     
     try:
         # Create Cognito client
-        client = boto3.client('cognito-idp', region_name=region)
+        client = get_client('cognito-idp', region)
         
         # Authenticate with username and password
-        response = client.initiate_auth(
-            ClientId=client_id,
-            AuthFlow='USER_PASSWORD_AUTH',
-            AuthParameters={
-                'USERNAME': username,
-                'PASSWORD': password
-            }
-        )
-        
-        # Extract the token
-        token = response['AuthenticationResult']['AccessToken']
+        token = _initiate_auth(client, client_id, username, password)
         
         # Print the token
         print("\nAccess Token (for Authorization: Bearer):")
@@ -62,16 +56,68 @@ def get_token(username=None, password=None, environment="dev", region=None):
         print(f"Error getting token: {str(e)}")
         sys.exit(1)
 
+async def get_tokens(users, environment="dev", region=None, concurrency=BATCH_CONCURRENCY):
+    """Get access tokens for many (username, password) pairs concurrently.
+
+    Returns a dict of username -> token (None if that user failed). The shared
+    client is thread-safe and retries throttled calls with adaptive backoff.
+    """
+    config = get_config_from_ssm(environment, region)
+    client_id = config.get('COGNITO_USER_CLIENT_ID')
+    if not client_id:
+        print("Error: COGNITO_USER_CLIENT_ID not found in SSM config")
+        sys.exit(1)
+
+    client = get_client('cognito-idp', region)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(username, password):
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_initiate_auth, client, client_id, username, password)
+            except Exception as e:
+                print(f"Error getting token for {username}: {str(e)}", file=sys.stderr)
+                return None
+
+    tokens = await asyncio.gather(*(fetch(username, password) for username, password in users))
+    return {username: token for (username, _), token in zip(users, tokens)}
+
+def read_batch_file(path):
+    """Read newline-separated username:password pairs, skipping blank lines"""
+    users = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            username, sep, password = line.partition(':')
+            if not sep:
+                print(f"Error: malformed line in batch file (expected username:password): {username}")
+                sys.exit(1)
+            users.append((username, password))
+    return users
+
 if __name__ == "__main__":
     # Add command line arguments
     parser = argparse.ArgumentParser(description='Get Cognito access token')
-    parser.add_argument('--username', required=True, help='Cognito username')
-    parser.add_argument('--password', required=True, help='Cognito password')
+    parser.add_argument('--username', help='Cognito username')
+    parser.add_argument('--password', help='Cognito password')
+    parser.add_argument('--batch-file', help='File of newline-separated username:password pairs to fetch tokens for in parallel')
     parser.add_argument('--environment', default='dev', help='Environment (default: dev)')
     parser.add_argument('--region', help='AWS region')
     parser.add_argument('--quiet', action='store_true', help='Only output the token')
     
     args = parser.parse_args()
+
+    if args.batch_file:
+        # One "username<TAB>token" line per user so the output is easy to script against
+        tokens = asyncio.run(get_tokens(read_batch_file(args.batch_file), args.environment, args.region))
+        for username, token in tokens.items():
+            print(f"{username}\t{token or ''}")
+        sys.exit(0 if all(tokens.values()) else 1)
+
+    if not args.username or not args.password:
+        parser.error('--username and --password are required unless --batch-file is given')
     
     # Get token
     token = get_token(args.username, args.password, args.environment, args.region)
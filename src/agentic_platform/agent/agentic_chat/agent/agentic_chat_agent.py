@@ -2,6 +2,7 @@
 
 import json
 import logging
+from functools import cached_property
 from typing import AsyncGenerator
 
 from strands import Agent
@@ -13,6 +14,7 @@ from agentic_platform.core.models.memory_models import Message, TextContent
 from agentic_platform.core.models.streaming_models import StreamEvent
 from agentic_platform.agent.agentic_chat.streaming.strands_converter import StrandsStreamingConverter
 from agentic_platform.core.client.llm_gateway.llm_gateway_client import LLMGatewayClient, LiteLLMClientInfo
+from agentic_platform.core.agent.agent_pool import AgentPool
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +23,16 @@ class StrandsAgenticChatAgent:
     """Agent implementation using Strands framework."""
 
     def __init__(self):
-        """Initialize the agent with the Strands framework."""
+        """Initialize the agent with the Strands framework.
 
+        The model and agents are built by the pool on first use so the server can
+        start (and answer health checks) without waiting on the LLM gateway.
+        """
+        self.pool = AgentPool(self._create_agent)
+
+    @cached_property
+    def model(self) -> OpenAIModel:
+        """The LiteLLM-backed model shared by every pooled agent."""
         # Grab the proxy URL from our gateway client. 
         litellm_info: LiteLLMClientInfo = LLMGatewayClient.get_client_info()
 
@@ -30,25 +40,34 @@ class StrandsAgenticChatAgent:
         # litellm object uses the LiteLLM SDK which has name conflicts when trying
         # to use the proxy so it's preferred to use the OpenAIModel type when calling
         # the actual proxy vs. just using the SDK. 
-        self.model = OpenAIModel(
+        return OpenAIModel(
             model_id="anthropic.claude-sonnet-4-20250514-v1:0",
             client_args={
                 "api_key": litellm_info.api_key,
                 "base_url": litellm_info.api_endpoint,
                 "timeout": 30
+            },
+            # Request a token stream explicitly and skip the trailing usage
+            # chunk, which can make the LiteLLM proxy buffer the stream.
+            params={
+                "stream": True,
+                "stream_options": {"include_usage": False}
             }
         )
 
-        self.agent = Agent(
+    def _create_agent(self) -> Agent:
+        """Build an agent wired to the shared model."""
+        return Agent(
             model=self.model,
             tools=[calculator]
         )
 
-    def invoke(self, request: AgenticRequest) -> AgenticResponse:
-        """Invoke the Strands agent synchronously."""
+    async def invoke(self, request: AgenticRequest) -> AgenticResponse:
+        """Invoke the Strands agent and return the complete response."""
         
         text_content = request.message.get_text_content()
-        result = self.agent(text_content.text)
+        async with self.pool.agent() as agent:
+            result = await agent.invoke_async(text_content.text)
         
         response_message = Message(
             role="assistant",
@@ -63,18 +82,19 @@ class StrandsAgenticChatAgent:
 
     async def invoke_stream(self, request: AgenticRequest) -> AsyncGenerator[StreamEvent, None]:
         """Invoke the Strands agent with streaming support using async iterator."""        
-        converter = StrandsStreamingConverter(request.session_id)
+        converter = StrandsStreamingConverter.for_session(request.session_id)
         text_content = request.message.get_text_content()
         
         try:
-            async for event in self.agent.stream_async(text_content.text):
-                # Convert Strands event to platform StreamEvents (can be multiple)
-                platform_events = converter.convert_chunks_to_events(event)
-                
-                # Yield each event
-                for platform_event in platform_events:
-                    yield platform_event
-                    
+            async with self.pool.agent() as agent:
+                async for event in agent.stream_async(text_content.text):
+                    # Convert Strands event to platform StreamEvents (can be multiple)
+                    platform_events = converter.convert_chunks_to_events(event)
+
+                    # Yield each event
+                    for platform_event in platform_events:
+                        yield platform_event
+
         except Exception as e:
             logger.error(f"Error in streaming: {e}")
             from agentic_platform.core.models.streaming_models import ErrorEvent
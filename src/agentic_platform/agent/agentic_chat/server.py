@@ -3,13 +3,14 @@
 import json
 import logging
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from agentic_platform.core.middleware.configure_middleware import configuration_server_middleware
 from agentic_platform.core.models.api_models import AgenticRequest, AgenticResponse
 from agentic_platform.core.decorator.api_error_decorator import handle_exceptions
+from agentic_platform.core.streaming.stream_batcher import BatchingStreamBuffer
 from agentic_platform.agent.agentic_chat.controller import agentic_chat_controller
 
 # Configure logging
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 # Initialize FastAPI app
-app = FastAPI(title="Agentic Chat Agent")
+app = FastAPI(title="Agentic Chat Agent", default_response_class=ORJSONResponse)
 
 # Configure middleware
 configuration_server_middleware(app, path_prefix="/api/agentic-chat")
@@ -42,12 +43,14 @@ async def stream(request: AgenticRequest) -> StreamingResponse:
     async def event_generator():
         """Convert StreamEvent objects to SSE format with event names."""
         try:
-            async for stream_event in agentic_chat_controller.create_stream(request):
-                # Convert StreamEvent to SSE format with event name
-                event_data = stream_event.model_dump(mode='json')
-                event_type = stream_event.type.value  # Get the enum value
-                sse_line = f"event: {event_type}\ndata: {json.dumps(event_data)}\n\n"
-                yield sse_line
+            # Coalesce bursts of small events into a single write to the client
+            async for batch in BatchingStreamBuffer(agentic_chat_controller.create_stream(request)):
+                sse_lines = []
+                for stream_event in batch:
+                    # Convert StreamEvent to SSE format with event name
+                    event_type = stream_event.type.value  # Get the enum value
+                    sse_lines.append(f"event: {event_type}\ndata: {stream_event.model_dump_json()}\n\n")
+                yield "".join(sse_lines)
         except Exception as e:
             logger.error(f"Error in streaming: {e}")
             error_data = {
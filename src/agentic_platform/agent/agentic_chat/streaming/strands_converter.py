@@ -1,5 +1,6 @@
 """Converter for Strands streaming events to platform streaming types."""
 
+import functools
 import logging
 import json
 from typing import List, Dict, Optional, Any
@@ -21,6 +22,16 @@ class StrandsStreamingConverter:
         """Initialize the converter."""
         self.session_id = session_id
 
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def for_session(cls, session_id: str) -> "StrandsStreamingConverter":
+        """Return a shared converter for the session.
+
+        The converter keeps no per-turn state, so every turn of a session can
+        reuse the same instance instead of building a new one per stream.
+        """
+        return cls(session_id)
+
     def convert_message_start(self, event: Dict[str, Any]) -> List[StreamEvent]:
         """Convert messageStart event."""
         return [StartEvent(session_id=self.session_id)]
@@ -1,7 +1,7 @@
 """Agentic RAG Agent implementation using Strands."""
 
-import os
 import logging
+from functools import cached_property
 from typing import AsyncGenerator
 
 from strands import Agent
@@ -12,7 +12,8 @@ from agentic_platform.core.models.memory_models import Message, TextContent
 from agentic_platform.core.models.streaming_models import StreamEvent
 from agentic_platform.core.converter.strands_converters import StrandsStreamingConverter
 from agentic_platform.core.client.llm_gateway.llm_gateway_client import LLMGatewayClient, LiteLLMClientInfo
-from agentic_platform.agent.agentic_rag.prompt.agentic_rag_prompt import AgenticRagPrompt
+from agentic_platform.core.agent.agent_pool import AgentPool
+from agentic_platform.agent.agentic_rag.prompt.agentic_rag_prompt import SYSTEM_PROMPT
 from agentic_platform.agent.agentic_rag.tool.kb_tool import search_knowledge_base
 
 logger = logging.getLogger(__name__)
@@ -22,32 +23,46 @@ class StrandsAgenticRagAgent:
     """RAG Agent implementation using Strands framework with Bedrock knowledge base."""
 
     def __init__(self):
-        """Initialize the RAG agent with Bedrock KB access."""
+        """Initialize the RAG agent with Bedrock KB access.
 
-        litellm_info: LiteLLMClientInfo = LLMGatewayClient.get_client_info()
+        The model and agents are built by the pool on first use so the server can
+        start (and answer health checks) without waiting on the LLM gateway.
+        """
+        self.pool = AgentPool(self._create_agent)
 
-        self.model = OpenAIModel(
+    @cached_property
+    def model(self) -> OpenAIModel:
+        """The LiteLLM-backed model shared by every pooled agent."""
+        litellm_info: LiteLLMClientInfo = LLMGatewayClient.get_client_info()
+        return OpenAIModel(
             model_id="anthropic.claude-sonnet-4-20250514-v1:0",
             client_args={
                 "api_key": litellm_info.api_key,
                 "base_url": litellm_info.api_endpoint,
                 "timeout": 30
+            },
+            # Request a token stream explicitly and skip the trailing usage
+            # chunk, which can make the LiteLLM proxy buffer the stream.
+            params={
+                "stream": True,
+                "stream_options": {"include_usage": False}
             }
         )
 
-        prompt: AgenticRagPrompt = AgenticRagPrompt()
-
-        self.agent = Agent(
+    def _create_agent(self) -> Agent:
+        """Build an agent wired to the shared model."""
+        return Agent(
             model=self.model,
-            system_prompt=prompt.system_prompt,
+            system_prompt=SYSTEM_PROMPT,
             tools=[search_knowledge_base]
         )
 
-    def invoke(self, request: AgenticRequest) -> AgenticResponse:
-        """Invoke the Strands agent synchronously."""
+    async def invoke(self, request: AgenticRequest) -> AgenticResponse:
+        """Invoke the Strands agent and return the complete response."""
         
         text_content = request.message.get_text_content()
-        result = self.agent(text_content.text)
+        async with self.pool.agent() as agent:
+            result = await agent.invoke_async(text_content.text)
         
         response_message = Message(
             role="assistant",
@@ -65,18 +80,19 @@ class StrandsAgenticRagAgent:
 
     async def invoke_stream(self, request: AgenticRequest) -> AsyncGenerator[StreamEvent, None]:
         """Invoke the Strands agent with streaming support using async iterator."""        
-        converter = StrandsStreamingConverter(request.session_id)
+        converter = StrandsStreamingConverter.for_session(request.session_id)
         text_content = request.message.get_text_content()
         
         try:
-            async for event in self.agent.stream_async(text_content.text):
-                # Convert Strands event to platform StreamEvents (can be multiple)
-                platform_events = converter.convert_chunks_to_events(event)
-                
-                # Yield each event
-                for platform_event in platform_events:
-                    yield platform_event
-                    
+            async with self.pool.agent() as agent:
+                async for event in agent.stream_async(text_content.text):
+                    # Convert Strands event to platform StreamEvents (can be multiple)
+                    platform_events = converter.convert_chunks_to_events(event)
+
+                    # Yield each event
+                    for platform_event in platform_events:
+                        yield platform_event
+
         except Exception as e:
             logger.error(f"Error in streaming: {e}")
             from agentic_platform.core.models.streaming_models import ErrorEvent
@@ -17,7 +17,7 @@ async def invoke(request: AgenticRequest) -> AgenticResponse:
     """Invoke the agent with a standard response."""
     if request.stream:
         raise ValueError("Streaming requests should use the /stream endpoint")
-    return agent.invoke(request)
+    return await agent.invoke(request)
 
 
 async def create_stream(request: AgenticRequest) -> AsyncGenerator[StreamEvent, None]:
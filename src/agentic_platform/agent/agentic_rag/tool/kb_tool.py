@@ -1,8 +1,12 @@
 """Knowledge Base search tool for Strands."""
 
 import os
+import asyncio
 import boto3
 import logging
+import threading
+from botocore.config import Config
+from cachetools import TTLCache
 from strands import tool
 
 logger = logging.getLogger(__name__)
@@ -13,10 +17,34 @@ knowledge_base_id = os.getenv('KNOWLEDGE_BASE_ID')
 if not knowledge_base_id:
     raise ValueError("KNOWLEDGE_BASE_ID environment variable must be set")
 
-client = boto3.client('bedrock-agent-runtime')
+# Size the connection pool for concurrent tool calls and keep sockets alive
+# between retrievals so we don't pay a TLS handshake per search.
+client = boto3.client(
+    'bedrock-agent-runtime',
+    config=Config(
+        max_pool_connections=64,
+        tcp_keepalive=True,
+        connect_timeout=2,
+        read_timeout=15,
+        retries={'mode': 'adaptive', 'max_attempts': 5}
+    )
+)
+
+RETRIEVAL_CONFIGURATION = {
+    'vectorSearchConfiguration': {
+        'numberOfResults': 5
+    }
+}
+
+# Agents often repeat the same search within a conversation, so keep recent
+# results around briefly. Very long queries are not cached to avoid filling
+# the cache with one-off prompts.
+MAX_CACHED_QUERY_LENGTH = 512
+_results_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+_results_cache_lock = threading.RLock()
 
 @tool
-def search_knowledge_base(query: str) -> str:
+async def search_knowledge_base(query: str) -> str:
     """Search the Bedrock knowledge base for relevant information.
     
     Args:
@@ -25,28 +53,36 @@ def search_knowledge_base(query: str) -> str:
     Returns:
         Relevant information from the knowledge base
     """
+    cache_key = query.strip().lower() if len(query) <= MAX_CACHED_QUERY_LENGTH else None
+    if cache_key is not None:
+        with _results_cache_lock:
+            cached = _results_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
-        response = client.retrieve(
+        # boto3 is blocking, so run the retrieval off the event loop to keep
+        # other streaming sessions moving while we wait on Bedrock.
+        response = await asyncio.to_thread(
+            client.retrieve,
             knowledgeBaseId=knowledge_base_id,
             retrievalQuery={'text': query},
-            retrievalConfiguration={
-                'vectorSearchConfiguration': {
-                    'numberOfResults': 5
-                }
-            }
+            retrievalConfiguration=RETRIEVAL_CONFIGURATION
         )
         
-        results = []
-        for result in response.get('retrievalResults', []):
-            content = result.get('content', {}).get('text', '')
-            if content:
-                results.append(content)
-        
-        if results:
-            return "\n\n".join(results)
-        else:
+        joined = "\n\n".join(
+            text
+            for result in response.get('retrievalResults', ())
+            if (text := result.get('content', {}).get('text'))
+        )
+        if not joined:
             return "No relevant information found in the knowledge base."
-            
+
+        if cache_key is not None:
+            with _results_cache_lock:
+                _results_cache[cache_key] = joined
+        return joined
+
     except Exception as e:
         logger.error(f"Error querying knowledge base: {e}")
         return f"Error accessing knowledge base: {str(e)}"
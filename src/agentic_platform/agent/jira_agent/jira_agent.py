@@ -1,7 +1,9 @@
 """Jira Agent implementation using Strands with MCP Knowledge Base integration."""
 
+import atexit
 import logging
 import os
+from functools import cached_property
 from typing import AsyncGenerator
 
 from mcp import stdio_client, StdioServerParameters
@@ -13,7 +15,8 @@ from agentic_platform.core.models.api_models import AgenticRequest, AgenticRespo
 from agentic_platform.core.models.memory_models import Message, TextContent
 from agentic_platform.core.models.streaming_models import StreamEvent
 from agentic_platform.core.converter.strands_converters import StrandsStreamingConverter
-from agentic_platform.agent.jira_agent.jira_prompt import JiraPrompt
+from agentic_platform.core.agent.agent_pool import AgentPool
+from agentic_platform.agent.jira_agent.jira_prompt import SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +25,12 @@ class StrandsJiraAgent:
     """Jira Agent implementation using Strands framework with MCP KB integration."""
 
     def __init__(self):
-        """Initialize the agent with Strands framework and MCP client."""
+        """Initialize the agent with Strands framework and MCP client.
 
-        # Use Bedrock directly for local testing
-        self.model = BedrockModel(
-            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-            region_name=os.getenv("AWS_REGION", "us-east-1")
-        )
-
-        self.prompt = JiraPrompt()
+        The model, MCP tools and agents are built by the pool on first use so the
+        server can start (and answer health checks) without waiting on AWS client setup.
+        """
+        self.pool = AgentPool(self._create_agent)
 
         # Initialize MCP client for Bedrock KB using stdio
         self.mcp_client = MCPClient(lambda: stdio_client(
@@ -45,19 +45,52 @@ class StrandsJiraAgent:
             )
         ))
 
-    def invoke(self, request: AgenticRequest) -> AgenticResponse:
-        """Invoke the Strands Jira agent synchronously."""
+    @cached_property
+    def model(self) -> BedrockModel:
+        """The Bedrock model shared by every pooled agent."""
+        # Use Bedrock directly for local testing
+        return BedrockModel(
+            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+            region_name=os.getenv("AWS_REGION", "us-east-1")
+        )
+
+    @cached_property
+    def tools(self) -> list:
+        """The KB tools listed from the MCP server.
 
-        text_content = request.message.get_text_content()
-        
-        with self.mcp_client:
+        The MCP client is started once and kept open for the lifetime of the pool
+        so we don't spawn the KB server subprocess and re-list tools per request.
+        """
+        self.mcp_client.start()
+        try:
             tools = self.mcp_client.list_tools_sync()
-            agent = Agent(
-                model=self.model,
-                system_prompt=self.prompt.system_prompt,
-                tools=tools
-            )
-            result = agent(text_content.text)
+        except Exception:
+            # Don't leave a half-started client behind, or every later start() fails
+            self.mcp_client.stop(None, None, None)
+            raise
+        atexit.register(self.close)
+        return tools
+
+    def _create_agent(self) -> Agent:
+        """Build an agent wired to the shared model and MCP tools."""
+        return Agent(
+            model=self.model,
+            system_prompt=SYSTEM_PROMPT,
+            tools=self.tools
+        )
+
+    def close(self) -> None:
+        """Stop the MCP client if it was started."""
+        if self.__dict__.pop("tools", None) is not None:
+            self.pool.clear()
+            self.mcp_client.stop(None, None, None)
+
+    async def invoke(self, request: AgenticRequest) -> AgenticResponse:
+        """Invoke the Strands Jira agent and return the complete response."""
+
+        text_content = request.message.get_text_content()
+        async with self.pool.agent() as agent:
+            result = await agent.invoke_async(text_content.text)
 
         response_message = Message(
             role="assistant",
@@ -72,17 +105,11 @@ class StrandsJiraAgent:
 
     async def invoke_stream(self, request: AgenticRequest) -> AsyncGenerator[StreamEvent, None]:
         """Invoke the Strands Jira agent with streaming support."""
-        converter = StrandsStreamingConverter(request.session_id)
+        converter = StrandsStreamingConverter.for_session(request.session_id)
         text_content = request.message.get_text_content()
 
         try:
-            with self.mcp_client:
-                tools = self.mcp_client.list_tools_sync()
-                agent = Agent(
-                    model=self.model,
-                    system_prompt=self.prompt.system_prompt,
-                    tools=tools
-                )
+            async with self.pool.agent() as agent:
                 async for event in agent.stream_async(text_content.text):
                     platform_events = converter.convert_chunks_to_events(event)
                     for platform_event in platform_events:
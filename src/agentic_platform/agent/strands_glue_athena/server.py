@@ -1,6 +1,7 @@
 """
 FastAPI server for the Strands Glue/Athena agent.
 """
+import os
 from fastapi import FastAPI
 import uvicorn
 from typing import Dict, Any
@@ -47,4 +48,16 @@ async def health():
 
 # Run the server with uvicorn
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)  # nosec B104 - Binding to all interfaces within container is intended
+    # "auto" picks uvloop + httptools when installed, for a faster event loop and HTTP parser
+    # than the asyncio/h11 defaults, and falls back to those defaults otherwise.
+    # Multiple workers need the app as an import string so each process can load it. A single
+    # worker gets the app object, so running this file doesn't import and build the app twice.
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    uvicorn.run(
+        "agentic_platform.agent.strands_glue_athena.server:app" if workers > 1 else app,
+        host="0.0.0.0",  # nosec B104 - Binding to all interfaces within container is intended
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=workers
+    )
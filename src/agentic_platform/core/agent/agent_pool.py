@@ -0,0 +1,80 @@
+"""Pool of ready-built Strands agents shared by the streaming agent servers."""
+
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException
+from strands import Agent
+
+# Number of ready-built agents kept around to absorb bursts of concurrent requests
+AGENT_POOL_SIZE = int(os.getenv("STRANDS_AGENT_POOL_SIZE", str(min(os.cpu_count() or 1, 8))))
+# How long a request may wait for a free agent before it is turned away with a 503
+AGENT_QUEUE_TIMEOUT_MS = int(os.getenv("AGENT_QUEUE_TIMEOUT_MS", "10000"))
+
+
+class AgentPool:
+    """
+    Hands out Strands agents one request at a time.
+
+    A Strands agent holds its conversation and can't run two invocations at once,
+    so each request checks out its own agent instead of sharing one. The agents
+    are built on first use so the server can start (and answer health checks)
+    without waiting on the model backend.
+    """
+
+    def __init__(
+        self,
+        create_agent: Callable[[], Agent],
+        size: int = AGENT_POOL_SIZE,
+        queue_timeout_ms: int = AGENT_QUEUE_TIMEOUT_MS,
+    ):
+        self._create_agent = create_agent
+        self.size = size
+        self.queue_timeout = queue_timeout_ms / 1000
+        self._lock = threading.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """The idle agents, built on first access."""
+        if self._queue is None:
+            with self._lock:
+                if self._queue is None:
+                    queue: asyncio.Queue = asyncio.Queue(maxsize=self.size)
+                    for _ in range(self.size):
+                        queue.put_nowait(self._create_agent())
+                    self._queue = queue
+        return self._queue
+
+    @asynccontextmanager
+    async def agent(self) -> AsyncIterator[Agent]:
+        """Check out an agent, with its conversation cleared, for the duration of the block.
+
+        The pool bounds how many requests hit the model at once; requests beyond
+        that queue here, but only briefly so a burst sheds load instead of
+        stacking up unbounded latency.
+        """
+        queue = self._queue
+        if queue is None:
+            # Building agents can block (model clients, MCP server start-up), so do it
+            # off the event loop rather than stalling every other request meanwhile
+            queue = await asyncio.to_thread(lambda: self.queue)
+        try:
+            agent = await asyncio.wait_for(queue.get(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Agent is at capacity, please retry")
+        # Don't let one request's conversation leak into the next one served by this agent
+        agent.messages.clear()
+        try:
+            yield agent
+        finally:
+            # Return it to the queue it came from, so a pool cleared meanwhile just drops it
+            queue.put_nowait(agent)
+
+    def clear(self) -> None:
+        """Drop the idle agents so the next checkout builds a fresh pool."""
+        with self._lock:
+            self._queue = None
@@ -1,22 +1,52 @@
+import asyncio
 import requests
 import json
 import os
 import httpx
+from functools import cached_property
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional, List, Generator, AsyncGenerator
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from agentic_platform.core.models.llm_models import LLMResponse, LLMRequest, Usage
-from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedResponse
+from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedBatchRequest, EmbedResponse
 from agentic_platform.core.models.memory_models import Message, ToolCall, TextContent
 from agentic_platform.core.context.request_context import get_auth_token
 from agentic_platform.core.converter.litellm_converters import LiteLLMRequestConverter, LiteLLMResponseConverter
 from agentic_platform.core.models.llm_models import LiteLLMClientInfo
+from agentic_platform.core.streaming.sse_decoder import SSEDecoder
 
 
 # Default to localhost:4000 if not specified
 LITELLM_API_ENDPOINT = os.getenv('LITELLM_API_ENDPOINT', 'http://localhost:4000')
 LITELLM_API_KEY = os.getenv('LITELLM_KEY')
 
+# Retry connection failures and statuses that mean the request was turned away
+# before reaching the model. Completions aren't idempotent, so read errors and
+# 502/504 (where the model may already have run, and billed) are not retried. The
+# final response is returned rather than raised so callers still see the usual
+# "LiteLLM API error".
+RETRY_POLICY = Retry(
+    total=2,
+    read=0,
+    other=0,
+    backoff_factor=0.1,
+    status_forcelist=[429, 503],
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+
+# Only this much of an error response body is read into the raised exception
+MAX_ERROR_BODY_BYTES = 2048
+
+# Data payload of the SSE event LiteLLM sends to mark the end of a stream
+STREAM_DONE = b"[DONE]"
+
+ASYNC_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+ASYNC_CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
 
 class LiteLLMGatewayClient:
     """
@@ -29,16 +59,59 @@ class LiteLLMGatewayClient:
         """
         self.api_endpoint = LITELLM_API_ENDPOINT
         self.api_key = api_key or LITELLM_API_KEY
+
+        # The API key is fixed for the client's lifetime, so build the headers once
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+        # Long-lived session so consecutive calls reuse keep-alive connections
+        # instead of paying a TCP/TLS handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=RETRY_POLICY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Shared async clients for streaming, created on first use. An httpx client's
+        # connections belong to the event loop that opened them, so keep one client
+        # per loop. Callers should aclose() on each loop they used before closing it.
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared async client for the running loop"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # A closed loop's client can no longer be used or closed, and its pooled
+            # connections keep the loop alive, so drop it to let both be freed
+            for stale_loop in list(self._async_clients):
+                if stale_loop.is_closed():
+                    self._async_clients.pop(stale_loop, None)
+            client = httpx.AsyncClient(limits=ASYNC_CLIENT_LIMITS, timeout=ASYNC_CLIENT_TIMEOUT)
+            self._async_clients[loop] = client
+        return client
+
+    def close(self) -> None:
+        """Release pooled connections"""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Release pooled connections, including the running loop's async client"""
+        self.close()
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "LiteLLMGatewayClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
         
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
-        # Try to get auth token from context, fall back to configured API key
-        auth_token = self.api_key
-        
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {auth_token}"
-        }
+        return self._headers
     
     def chat_invoke(self, request: LLMRequest) -> LLMResponse:
         """
@@ -48,16 +121,17 @@ class LiteLLMGatewayClient:
         payload = LiteLLMRequestConverter.convert_llm_request(request)
         
         # Make the API request
-        response = requests.post(
+        response = self._session.post(
             f"{self.api_endpoint}/v1/chat/completions",
-            headers=self._get_headers(),
-            json=payload
+            headers=self._headers,
+            data=to_json(payload),
+            # Defer the body download so an error body is only read up to the cap
+            stream=True
         )
         
         # Check for errors
         if response.status_code != 200:
-            error_message = f"LiteLLM API error: {response.status_code} - {response.text}"
-            raise Exception(error_message)
+            raise self._api_error(response)
         
         # Parse the response
         litellm_response = response.json()
@@ -74,34 +148,35 @@ class LiteLLMGatewayClient:
         payload["stream"] = True
         
         # Make the streaming API request
-        response = requests.post(
+        response = self._session.post(
             f"{self.api_endpoint}/v1/chat/completions",
-            headers=self._get_headers(),
-            json=payload,
+            headers=self._headers,
+            data=to_json(payload),
             stream=True
         )
         
         # Check for errors
         if response.status_code != 200:
-            error_message = f"LiteLLM API error: {response.status_code} - {response.text}"
-            raise Exception(error_message)
+            raise self._api_error(response)
         
-        # Process streaming response
+        # Process streaming response, framing SSE events straight from the raw bytes
         accumulated_state = {}
+        decoder = SSEDecoder()
         
-        for line in response.iter_lines(decode_unicode=True):
-            if not line:
-                continue
-            
-            # Parse the streaming line
-            chunk_data = LiteLLMResponseConverter.parse_streaming_line(line)
-            
-            if not chunk_data or chunk_data.get("done"):
-                continue
-            
-            # Process the chunk and yield response
-            llm_response = LiteLLMResponseConverter.process_streaming_chunk(chunk_data, accumulated_state)
-            yield llm_response
+        try:
+            chunks = response.iter_content(chunk_size=8192)
+            for chunk in chunks:
+                events = decoder.feed(chunk)
+                yield from self._process_stream_events(events, accumulated_state)
+                if STREAM_DONE in events:
+                    # Nothing after the end marker is yielded, but read on to the end of the
+                    # body so the connection goes back to the pool instead of being dropped
+                    for _ in chunks:
+                        pass
+                    return
+            yield from self._process_stream_events(decoder.finish(), accumulated_state)
+        finally:
+            response.close()
     
     async def chat_invoke_stream_async(self, request: LLMRequest) -> AsyncGenerator[LLMResponse, None]:
         """
@@ -111,79 +186,130 @@ class LiteLLMGatewayClient:
         payload = LiteLLMRequestConverter.convert_llm_request(request)
         payload["stream"] = True
         
-        # Make the async streaming API request
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                f"{self.api_endpoint}/v1/chat/completions",
-                headers=self._get_headers(),
-                json=payload
-            ) as response:
-                
-                # Check for errors
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    error_message = f"LiteLLM API error: {response.status_code} - {error_text.decode()}"
-                    raise Exception(error_message)
-                
-                # Process streaming response
-                accumulated_state = {}
-                
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-                    
-                    # Parse the streaming line
-                    chunk_data = LiteLLMResponseConverter.parse_streaming_line(line)
-                    
-                    if not chunk_data or chunk_data.get("done"):
-                        continue
-                    
-                    # Process the chunk and yield response
-                    llm_response = LiteLLMResponseConverter.process_streaming_chunk(chunk_data, accumulated_state)
+        # Make the async streaming API request over the shared connection pool
+        async with self._get_async_client().stream(
+            "POST",
+            f"{self.api_endpoint}/v1/chat/completions",
+            headers=self._headers,
+            content=to_json(payload)
+        ) as response:
+            
+            # Check for errors
+            if response.status_code != 200:
+                error_text = bytearray()
+                async for chunk in response.aiter_bytes():
+                    error_text.extend(chunk)
+                    if len(error_text) >= MAX_ERROR_BODY_BYTES:
+                        break
+                error_body = error_text[:MAX_ERROR_BODY_BYTES].decode("utf-8", "replace")
+                error_message = f"LiteLLM API error: {response.status_code} - {error_body}"
+                raise Exception(error_message)
+            
+            # Process streaming response, framing SSE events straight from the raw bytes
+            accumulated_state = {}
+            decoder = SSEDecoder()
+            
+            chunks = response.aiter_bytes()
+            async for chunk in chunks:
+                events = decoder.feed(chunk)
+                for llm_response in self._process_stream_events(events, accumulated_state):
                     yield llm_response
+                if STREAM_DONE in events:
+                    # Nothing after the end marker is yielded, but read on to the end of the
+                    # body so the connection goes back to the pool instead of being dropped
+                    async for _ in chunks:
+                        pass
+                    return
+            for llm_response in self._process_stream_events(decoder.finish(), accumulated_state):
+                yield llm_response
+
+    @staticmethod
+    def _api_error(response: requests.Response) -> Exception:
+        """Build the API error from the status and the start of the body, without reading all of it"""
+        error_body = next(response.iter_content(MAX_ERROR_BODY_BYTES), b"")
+        response.close()
+        return Exception(f"LiteLLM API error: {response.status_code} - {error_body[:MAX_ERROR_BODY_BYTES].decode('utf-8', 'replace')}")
+
+    @staticmethod
+    def _process_stream_events(events: List[bytes], accumulated_state: Dict[str, Any]) -> Generator[LLMResponse, None, None]:
+        """Convert complete SSE event payloads into responses, skipping the [DONE] marker"""
+        for data in events:
+            if data == STREAM_DONE:
+                continue
+            
+            chunk_data = LiteLLMResponseConverter.parse_streaming_data(data)
+            
+            if not chunk_data or chunk_data.get("done"):
+                continue
+            
+            yield LiteLLMResponseConverter.process_streaming_chunk(chunk_data, accumulated_state)
     
     def embed_invoke(self, request: EmbedRequest) -> EmbedResponse:
         """
         Send an embedding request to the LiteLLM API.
         """
+        data = self._post_embeddings(request.model_id, request.text)
+        
+        # Extract the embedding
+        embedding = []
+        if data:
+            embedding = data[0].get("embedding", [])
+        
+        # Return the embedding response
+        return EmbedResponse(embedding=embedding)
+    
+    def embed_invoke_batch(self, request: EmbedBatchRequest) -> List[EmbedResponse]:
+        """
+        Embed several texts with a single request to the LiteLLM API.
+        Returns one EmbedResponse per input text, in input order.
+        """
+        if not request.texts:
+            return []
+        
+        data = self._post_embeddings(request.model_id, request.texts)
+        
+        # The API tags each embedding with the index of its input
+        data = sorted(data, key=lambda item: item.get("index", 0))
+        return [EmbedResponse(embedding=item.get("embedding", [])) for item in data]
+    
+    def _post_embeddings(self, model_id: str, embedding_input: Any) -> List[Dict[str, Any]]:
+        """Call the embeddings endpoint and return the response's data list"""
         # Prepare the request payload
         payload = {
-            "model": request.model_id,
-            "input": request.text
+            "model": model_id,
+            "input": embedding_input
         }
         
         # Make the API request
-        response = requests.post(
+        response = self._session.post(
             f"{self.api_endpoint}/v1/embeddings",
-            headers=self._get_headers(),
-            json=payload
+            headers=self._headers,
+            data=to_json(payload),
+            # Defer the body download so an error body is only read up to the cap
+            stream=True
         )
         
         # Check for errors
         if response.status_code != 200:
-            error_message = f"LiteLLM API error: {response.status_code} - {response.text}"
-            raise Exception(error_message)
+            raise self._api_error(response)
         
         # Parse the response
-        litellm_response = response.json()
-        
-        # Extract the embedding
-        embedding = []
-        if "data" in litellm_response and litellm_response["data"]:
-            embedding = litellm_response["data"][0].get("embedding", [])
-        
-        # Return the embedding response
-        return EmbedResponse(embedding=embedding)
+        return response.json().get("data") or []
     
-    def get_client(self) -> LiteLLMClientInfo:
+    @cached_property
+    def client_info(self) -> LiteLLMClientInfo:
         """
-        Return a simple client object that can be used with other libraries.
-        This is a placeholder since LiteLLM doesn't have a direct client library like boto3.
+        Connection details for other libraries, built once since the endpoint
+        and key are fixed for the client's lifetime.
         """
-        # Return a simple object with the API endpoint and headers
-
         return LiteLLMClientInfo(
             api_key=self.api_key,
             api_endpoint=f"{self.api_endpoint}/v1"
         )
+
+    def get_client(self) -> LiteLLMClientInfo:
+        """
+        Return a simple client object that can be used with other libraries.
+        This is a placeholder since LiteLLM doesn't have a direct client library like boto3.
+        """
+        return self.client_info
@@ -1,10 +1,10 @@
 
 from agentic_platform.core.models.llm_models import LLMRequest, LLMResponse
-from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedResponse
+from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedBatchRequest, EmbedResponse
 from agentic_platform.core.client.llm_gateway.bedrock_gateway_client import BedrockGatewayClient
 from agentic_platform.core.client.llm_gateway.litellm_gateway_client import LiteLLMGatewayClient, LiteLLMClientInfo
 # from openai import AsyncOpenAI
-from typing import Any, Dict
+from typing import Any, Dict, List
 from pydantic import BaseModel
 
 
@@ -23,6 +23,10 @@ class LLMGatewayClient:
     def embed_invoke(request: EmbedRequest) -> EmbedResponse:
         return litellm_client.embed_invoke(request=request)
 
+    @staticmethod
+    def embed_invoke_batch(request: EmbedBatchRequest) -> List[EmbedResponse]:
+        return litellm_client.embed_invoke_batch(request=request)
+
     @staticmethod
     def get_client_info() -> LiteLLMClientInfo:
         return litellm_client.get_client()
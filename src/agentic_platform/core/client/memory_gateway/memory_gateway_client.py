@@ -1,5 +1,7 @@
 import os
+import threading
 import requests
+from typing import Optional
 from agentic_platform.core.models.memory_models import (
     GetSessionContextRequest,
     GetSessionContextResponse,
@@ -13,12 +15,39 @@ from agentic_platform.core.models.memory_models import (
 from agentic_platform.core.context.request_context import get_auth_token
 MEMORY_GATEWAY_URL = os.getenv("MEMORY_GATEWAY_ENDPOINT")
 DEFAULT_TIMEOUT = 7  # Default timeout in seconds
+SESSION_CACHE_TTL = int(os.getenv("MEMORY_SESSION_CACHE_TTL", "0"))  # Seconds, 0 (the default) disables the cache
 
 class MemoryGatewayClient:
     """
     Shim for calling a memory gateway through a microservice. 
     Makes it easy to swap out memory gateways, add graph RAG, etc..
+
+    Session lookups by session_id can be cached briefly (read-through, and refreshed
+    on upsert) by setting MEMORY_SESSION_CACHE_TTL, so hot sessions don't pay a
+    gateway round trip at the start of every turn. Entries are keyed by the caller's
+    auth token as well so one caller can never be served another caller's cached session.
+
+    The cache is local to the process, so it is only safe when a single replica
+    serves each session. With several replicas behind a load balancer, one replica
+    can read its stale copy of a session another replica has since updated and then
+    overwrite that turn in the gateway, so leave the cache off in that setup.
     """
+
+    _session_cache: Optional["TTLCache"] = None
+    _session_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_session_cache(cls) -> "TTLCache":
+        """Create the cache on first use; call with the lock held."""
+        if cls._session_cache is None:
+            # Imported here so cachetools is only needed when the cache is enabled
+            from cachetools import TTLCache
+            cls._session_cache = TTLCache(maxsize=10_000, ttl=SESSION_CACHE_TTL)
+        return cls._session_cache
+
+    @classmethod
+    def _session_cache_key(cls, session_id):
+        return (get_auth_token(), session_id)
     
     @classmethod
     def _get_auth_headers(cls):
@@ -30,6 +59,16 @@ class MemoryGatewayClient:
     
     @classmethod
     def get_session_context(cls, request: GetSessionContextRequest) -> GetSessionContextResponse:
+        # Only plain session_id lookups are cached; user-wide listings always hit the gateway
+        cacheable = SESSION_CACHE_TTL > 0 and request.session_id and not request.user_id
+        if cacheable:
+            key = cls._session_cache_key(request.session_id)
+            with cls._session_cache_lock:
+                cached = cls._get_session_cache().get(key)
+            if cached is not None:
+                # Hand out a copy so callers mutating the context don't corrupt the cache
+                return cached.model_copy(deep=True)
+
         headers = cls._get_auth_headers()
         response = requests.post(
             f"{MEMORY_GATEWAY_URL}/get-session-context", 
@@ -38,7 +77,12 @@ class MemoryGatewayClient:
             headers=headers
         )
         response.raise_for_status()
-        return GetSessionContextResponse(**response.json())
+        result = GetSessionContextResponse(**response.json())
+
+        if cacheable:
+            with cls._session_cache_lock:
+                cls._get_session_cache()[key] = result.model_copy(deep=True)
+        return result
     
     @classmethod
     def upsert_session_context(cls, request: UpsertSessionContextRequest) -> UpsertSessionContextResponse:
@@ -50,7 +94,16 @@ class MemoryGatewayClient:
             headers=headers
         )
         response.raise_for_status()
-        return UpsertSessionContextResponse(**response.json())
+        result = UpsertSessionContextResponse(**response.json())
+
+        # Write through so the next turn reads the context we just saved
+        if SESSION_CACHE_TTL > 0:
+            key = cls._session_cache_key(result.session_context.session_id)
+            with cls._session_cache_lock:
+                cls._get_session_cache()[key] = GetSessionContextResponse(
+                    results=[result.session_context.model_copy(deep=True)]
+                )
+        return result
     
     @classmethod
     def get_memories(cls, request: GetMemoriesRequest) -> GetMemoriesResponse:
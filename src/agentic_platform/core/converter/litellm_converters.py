@@ -1,5 +1,6 @@
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
+from pydantic_core import from_json
 from agentic_platform.core.models.llm_models import LLMResponse, LLMRequest, Usage
 from agentic_platform.core.models.memory_models import Message, ToolCall, TextContent
 
@@ -164,19 +165,29 @@ class LiteLLMResponseConverter:
         )
     
     @staticmethod
-    def parse_streaming_line(line: str) -> Dict[str, Any]:
-        """Parse a streaming response line from LiteLLM"""
-        if not line.startswith('data: '):
+    def parse_streaming_line(line: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse a streaming response line from LiteLLM.
+
+        Accepts raw bytes so the hot streaming path can skip decoding each line
+        to str; the JSON is parsed with pydantic-core's native parser.
+        """
+        if isinstance(line, str):
+            line = line.encode()
+
+        if not line.startswith(b'data: '):
             return {}
         
-        data_part = line[6:]  # Remove 'data: ' prefix
-        
-        if data_part.strip() == '[DONE]':
+        return LiteLLMResponseConverter.parse_streaming_data(line[6:])  # Remove 'data: ' prefix
+
+    @staticmethod
+    def parse_streaming_data(data: bytes) -> Dict[str, Any]:
+        """Parse the data payload of a single streamed SSE event"""
+        if data.strip() == b'[DONE]':
             return {"done": True}
         
         try:
-            return json.loads(data_part)
-        except json.JSONDecodeError:
+            return from_json(data)
+        except ValueError:
             return {}
     
     @staticmethod
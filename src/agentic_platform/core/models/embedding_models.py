@@ -1,21 +1,25 @@
-from pydantic import BaseModel, field_validator
-from typing import List
+from pydantic import AfterValidator, BaseModel
+from typing import Annotated, List
 
 SUPPORTED_MODELS: List[str] = [
     "amazon.titan-embed-text-v2:0",
 ]
 
+def _check_supported_model(model_id: str) -> str:
+    if model_id not in SUPPORTED_MODELS:
+        raise ValueError(f"Model ID {model_id} is not supported")
+    return model_id
+
+# A model ID checked against the supported embedding models
+SupportedModelId = Annotated[str, AfterValidator(_check_supported_model)]
+
 class EmbedRequest(BaseModel):
     text: str
-    model_id: str
-
-    # Check for supported models
-    @field_validator("model_id")
-    @classmethod
-    def validate_model_id(cls, v, info):
-        if v not in SUPPORTED_MODELS:
-            raise ValueError(f"Model ID {v} is not supported")
-        return v
+    model_id: SupportedModelId
+    
+class EmbedBatchRequest(BaseModel):
+    texts: List[str]
+    model_id: SupportedModelId
     
 class EmbedResponse(BaseModel):
     embedding: List[float]
\ No newline at end of file
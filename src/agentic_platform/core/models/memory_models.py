@@ -120,11 +120,7 @@ class Message(BaseModel):
         return datetime.fromtimestamp(self.timestamp)
 
     def _get_content_by_type(self, content_type: str):
-        if self.content:
-            for item in self.content:
-                if getattr(item, 'type', None) == content_type:
-                    return item
-        return None
+        return next((item for item in self.content or () if getattr(item, 'type', None) == content_type), None)
 
     def get_text_content(self) -> Optional[TextContent]:
         return self._get_content_by_type("text")
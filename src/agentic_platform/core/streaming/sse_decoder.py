@@ -0,0 +1,42 @@
+"""Incremental decoder for Server-Sent Events byte streams."""
+
+from typing import List
+
+
+class SSEDecoder:
+    """
+    Frames a raw SSE byte stream into complete event data payloads.
+
+    Network reads can split an event, or a single line, at any byte. Bytes are
+    buffered until a full line arrives, and an event's data is only emitted once
+    its terminating blank line is seen, so a fragmented JSON payload is never
+    handed to the parser half-received. Multiple data lines in one event are
+    joined with newlines as the SSE spec requires.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add raw bytes and return the data of every event they completed."""
+        self._buffer.extend(chunk)
+        events: List[bytes] = []
+        start = 0
+        while (end := self._buffer.find(b"\n", start)) != -1:
+            line = bytes(self._buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            if not line:
+                # A blank line dispatches the event collected so far
+                if self._data:
+                    events.append(b"\n".join(self._data))
+                    self._data = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                self._data.append(value[1:] if value.startswith(b" ") else value)
+        del self._buffer[:start]
+        return events
+
+    def finish(self) -> List[bytes]:
+        """Flush an event left unterminated when the stream closed."""
+        return self.feed(b"\n\n")
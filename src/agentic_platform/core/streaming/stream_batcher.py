@@ -0,0 +1,87 @@
+"""Coalesces items from an async stream into small, time-bounded batches."""
+
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class _StreamFailure:
+    """Carries an exception raised by the source across the queue."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class BatchingStreamBuffer(Generic[T]):
+    """
+    Groups items from an async iterator so consumers can write them out together.
+
+    Streaming agents emit many tiny events (one per token delta). Writing each one
+    to the client separately means one ASGI send per token, so under load the
+    per-event overhead dominates. This buffer collects events and flushes a batch
+    once it holds max_items or max_delay_ms has passed since its first event,
+    whichever comes first.
+    """
+
+    def __init__(self, source: AsyncIterator[T], max_items: int = 8, max_delay_ms: float = 50):
+        self.source = source
+        self.max_items = max_items
+        self.max_delay = max_delay_ms / 1000
+
+    async def _pump(self, queue: asyncio.Queue) -> None:
+        """Read the source into the queue. Runs as a separate task so a flush timeout never cancels the source."""
+        # Cancellation is deliberately not caught: the consumer has gone away, and
+        # awaiting a put on a full queue nobody reads would never return.
+        try:
+            async for item in self.source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_StreamFailure(e))
+        else:
+            await queue.put(_END)
+
+    async def __aiter__(self) -> AsyncGenerator[List[T], None]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_items * 4)
+        pump = asyncio.create_task(self._pump(queue))
+
+        try:
+            while True:
+                # Block for the first item of a batch; only later items are time-bounded
+                item = await queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _StreamFailure):
+                    raise item.error
+
+                batch: List[T] = [item]
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_items:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _END or isinstance(item, _StreamFailure):
+                        # Flush what we have before ending or surfacing the failure
+                        yield batch
+                        if isinstance(item, _StreamFailure):
+                            raise item.error
+                        return
+                    batch.append(item)
+
+                yield batch
+        finally:
+            # Stop the pump before closing the source so the two never run concurrently,
+            # then close the source explicitly so its cleanup (e.g. returning a pooled
+            # agent) runs now rather than whenever the generator is garbage collected.
+            pump.cancel()
+            await asyncio.wait({pump})
+            aclose = getattr(self.source, "aclose", None)
+            if aclose is not None:
+                await aclose()
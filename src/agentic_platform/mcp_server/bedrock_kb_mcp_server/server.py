@@ -1,9 +1,11 @@
 """MCP Server for AWS Bedrock Knowledge Base queries."""
 
+import asyncio
 import os
 import logging
 from typing import Any, Dict, Optional
 import boto3
+from botocore.config import Config
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import Response
@@ -29,9 +31,18 @@ class BedrockKnowledgeBaseMCPServer:
         if not self.knowledge_base_id:
             raise ValueError("KNOWLEDGE_BASE_ID environment variable must be set")
 
-        # Initialize boto3 client
+        # Initialize boto3 client with a larger keep-alive pool so concurrent
+        # retrieve calls reuse HTTPS connections instead of re-handshaking
         region = os.getenv('AWS_REGION', 'us-east-1')
-        self.bedrock_client = boto3.client('bedrock-agent-runtime', region_name=region)
+        client_config = Config(
+            region_name=region,
+            max_pool_connections=50,
+            retries={'mode': 'adaptive', 'max_attempts': 3},
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=30
+        )
+        self.bedrock_client = boto3.client('bedrock-agent-runtime', config=client_config)
 
         logger.info(f"Initialized Bedrock KB MCP Server with Knowledge Base ID: {self.knowledge_base_id}")
 
@@ -42,7 +53,7 @@ class BedrockKnowledgeBaseMCPServer:
         """Register all tools with the MCP server."""
 
         @self.mcp.tool()
-        def query_knowledge_base(query: str) -> str:
+        async def query_knowledge_base(query: str) -> str:
             """Query the AWS Bedrock Knowledge Base for relevant information.
 
             This tool searches the knowledge base using the provided query text
@@ -55,11 +66,12 @@ class BedrockKnowledgeBaseMCPServer:
                 Relevant information from the knowledge base, or an error message
             """
             try:
-                logger.info(f"Querying knowledge base with: {query}")
-                logger.info(f"Knowledge Base ID: {self.knowledge_base_id}")
+                logger.info("Querying knowledge base %s with: %s", self.knowledge_base_id, query)
 
-                # Call Bedrock Knowledge Base retrieve API
-                response = self.bedrock_client.retrieve(
+                # Call Bedrock Knowledge Base retrieve API off the event loop so
+                # concurrent tool calls can overlap on the client's connection pool
+                response = await asyncio.to_thread(
+                    self.bedrock_client.retrieve,
                     knowledgeBaseId=self.knowledge_base_id,
                     retrievalQuery={'text': query},
                     retrievalConfiguration={
@@ -69,28 +81,32 @@ class BedrockKnowledgeBaseMCPServer:
                     }
                 )
 
-                logger.info(f"Raw response keys: {response.keys()}")
-                logger.info(f"Number of results: {len(response.get('retrievalResults', []))}")
-
-                # Extract text content from results
-                results = []
-                for i, result in enumerate(response.get('retrievalResults', [])):
-                    content = result.get('content', {}).get('text', '')
-                    score = result.get('score', 0)
-                    source = result.get('location', {}).get('s3Location', {}).get('uri', 'unknown')
-                    logger.info(f"Result {i}: score={score:.4f}, source={source}, content_len={len(content)}")
-                    if content:
-                        results.append(f"[Score: {score:.4f}]\n{content}")
-
-                if results:
-                    logger.info(f"Returning {len(results)} results")
-                    return "\n\n---\n\n".join(results)
+                retrieval_results = response.get('retrievalResults', ())
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Raw response keys: %s", list(response.keys()))
+                    logger.debug("Number of results: %d", len(retrieval_results))
+                    for i, result in enumerate(retrieval_results):
+                        source = result.get('location', {}).get('s3Location', {}).get('uri', 'unknown')
+                        content_len = len(result.get('content', {}).get('text', ''))
+                        logger.debug("Result %d: score=%.4f, source=%s, content_len=%d", i, result.get('score', 0), source, content_len)
+
+                # Join the text of each non-empty result in a single pass
+                joined = "\n\n---\n\n".join(
+                    "[Score: %.4f]\n%s" % (result.get('score', 0), text)
+                    for result in retrieval_results
+                    if (text := result.get('content', {}).get('text'))
+                )
+
+                if joined:
+                    logger.info("Returning results for query")
+                    return joined
                 else:
                     logger.warning("No results found for query")
                     return "No relevant information found in the knowledge base."
 
             except Exception as e:
-                logger.error(f"Error querying knowledge base: {str(e)}", exc_info=True)
+                logger.error("Error querying knowledge base: %s", e, exc_info=True)
                 return f"Error accessing knowledge base: {str(e)}"
 
     def get_server(self) -> FastMCP:
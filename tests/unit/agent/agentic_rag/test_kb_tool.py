@@ -0,0 +1,99 @@
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+from cachetools import TTLCache
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+# KNOWLEDGE_BASE_ID, read when the tool module is imported, is set in tests/conftest.py
+from agentic_platform.agent.agentic_rag.tool import kb_tool
+from agentic_platform.agent.agentic_rag.tool.kb_tool import search_knowledge_base, MAX_CACHED_QUERY_LENGTH
+
+
+def _retrieve_response(*texts):
+    return {'retrievalResults': [{'content': {'text': text}} for text in texts]}
+
+
+@pytest.fixture
+def clock():
+    """Fake clock driving the results cache's TTL"""
+    return [0.0]
+
+
+@pytest.fixture(autouse=True)
+def results_cache(clock):
+    """Give each test an empty results cache"""
+    cache = TTLCache(maxsize=512, ttl=300, timer=lambda: clock[0])
+    with patch.object(kb_tool, '_results_cache', cache):
+        yield cache
+
+
+@pytest.fixture
+def mock_retrieve():
+    with patch.object(kb_tool.client, 'retrieve') as mock:
+        mock.return_value = _retrieve_response('first passage', 'second passage')
+        yield mock
+
+
+class TestSearchKnowledgeBaseCache:
+    """Test caching of knowledge base search results"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_hits_bedrock_once(self, mock_retrieve):
+        """Test that repeating a query, in any case or spacing, is served from the cache"""
+        first = await search_knowledge_base('What is the refund policy?')
+        second = await search_knowledge_base('  what is the REFUND policy?  ')
+
+        assert first == second == 'first passage\n\nsecond passage'
+        mock_retrieve.assert_called_once_with(
+            knowledgeBaseId=kb_tool.knowledge_base_id,
+            retrievalQuery={'text': 'What is the refund policy?'},
+            retrievalConfiguration=kb_tool.RETRIEVAL_CONFIGURATION
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_result_expires(self, mock_retrieve, clock):
+        """Test that a result is fetched again once the TTL has passed"""
+        await search_knowledge_base('refund policy')
+        clock[0] += 301
+        await search_knowledge_base('refund policy')
+
+        assert mock_retrieve.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_long_query_is_not_cached(self, mock_retrieve, results_cache):
+        """Test that queries over the length limit always go to Bedrock"""
+        query = 'x' * (MAX_CACHED_QUERY_LENGTH + 1)
+
+        await search_knowledge_base(query)
+        await search_knowledge_base(query)
+
+        assert mock_retrieve.call_count == 2
+        assert len(results_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_not_cached(self, mock_retrieve, results_cache):
+        """Test that a failed retrieval is retried on the next call"""
+        mock_retrieve.side_effect = [RuntimeError('throttled'), _retrieve_response('passage')]
+
+        first = await search_knowledge_base('refund policy')
+        second = await search_knowledge_base('refund policy')
+
+        assert first == 'Error accessing knowledge base: throttled'
+        assert second == 'passage'
+        assert mock_retrieve.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self, mock_retrieve, results_cache):
+        """Test that finding nothing is not remembered, so new documents show up"""
+        mock_retrieve.return_value = _retrieve_response()
+
+        result = await search_knowledge_base('refund policy')
+        await search_knowledge_base('refund policy')
+
+        assert result == 'No relevant information found in the knowledge base.'
+        assert mock_retrieve.call_count == 2
+        assert len(results_cache) == 0
@@ -0,0 +1,47 @@
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.agent.jira_agent.jira_agent import StrandsJiraAgent
+
+
+@pytest.fixture
+def jira_agent():
+    """Create a Jira agent with a mocked MCP client"""
+    agent = StrandsJiraAgent()
+    agent.mcp_client = MagicMock()
+    return agent
+
+
+class TestStrandsJiraAgentTools:
+    """Test starting the MCP client that provides the Jira agent's tools"""
+
+    @patch('agentic_platform.agent.jira_agent.jira_agent.atexit')
+    def test_tools_listed_once_and_client_stopped_on_exit(self, mock_atexit, jira_agent):
+        """Test that the MCP client is started once and registered for shutdown"""
+        jira_agent.mcp_client.list_tools_sync.return_value = ["kb_tool"]
+
+        assert jira_agent.tools == ["kb_tool"]
+        assert jira_agent.tools == ["kb_tool"]
+
+        jira_agent.mcp_client.start.assert_called_once()
+        mock_atexit.register.assert_called_once_with(jira_agent.close)
+
+    @patch('agentic_platform.agent.jira_agent.jira_agent.atexit')
+    def test_failed_tool_listing_stops_client_so_it_can_retry(self, mock_atexit, jira_agent):
+        """Test that a failure after start() stops the client and the next access starts it again"""
+        jira_agent.mcp_client.list_tools_sync.side_effect = [RuntimeError("KB server died"), ["kb_tool"]]
+
+        with pytest.raises(RuntimeError, match="KB server died"):
+            jira_agent.tools
+
+        jira_agent.mcp_client.stop.assert_called_once_with(None, None, None)
+        mock_atexit.register.assert_not_called()
+
+        assert jira_agent.tools == ["kb_tool"]
+        assert jira_agent.mcp_client.start.call_count == 2
+        mock_atexit.register.assert_called_once_with(jira_agent.close)
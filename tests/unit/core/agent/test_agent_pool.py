@@ -0,0 +1,106 @@
+"""
+Unit tests for the AgentPool.
+
+This module contains unit tests for checking Strands agents out of the
+shared pool used by the streaming agent servers.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+import threading
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.core.agent.agent_pool import AgentPool
+
+
+def _fake_agent():
+    agent = MagicMock()
+    agent.messages = []
+    return agent
+
+
+class TestAgentPool:
+    """Unit tests for AgentPool"""
+
+    def test_agents_built_on_first_use(self):
+        """Test that no agent is created until the pool is first used"""
+        create_agent = MagicMock(side_effect=_fake_agent)
+        pool = AgentPool(create_agent, size=3)
+
+        create_agent.assert_not_called()
+        assert pool.queue.qsize() == 3
+        assert create_agent.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_first_checkout_builds_agents_off_the_event_loop(self):
+        """Test that slow agent construction doesn't run on the event loop thread"""
+        build_threads = []
+
+        def create_agent():
+            build_threads.append(threading.get_ident())
+            return _fake_agent()
+
+        pool = AgentPool(create_agent, size=2)
+        async with pool.agent():
+            pass
+
+        assert len(build_threads) == 2
+        assert threading.get_ident() not in build_threads
+
+    @pytest.mark.asyncio
+    async def test_checkout_clears_conversation_and_returns_agent(self):
+        """Test that a checked-out agent starts empty and goes back to the pool"""
+        pool = AgentPool(_fake_agent, size=1)
+
+        async with pool.agent() as agent:
+            agent.messages.append("previous turn")
+            assert pool.queue.qsize() == 0
+
+        async with pool.agent() as same_agent:
+            assert same_agent is agent
+            assert same_agent.messages == []
+
+        assert pool.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_returned_when_block_raises(self):
+        """Test that an error inside the block still returns the agent"""
+        pool = AgentPool(_fake_agent, size=1)
+
+        with pytest.raises(RuntimeError):
+            async with pool.agent():
+                raise RuntimeError("boom")
+
+        assert pool.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_sheds_load_with_503(self):
+        """Test that a request waiting past the queue timeout is rejected"""
+        pool = AgentPool(_fake_agent, size=1, queue_timeout_ms=10)
+
+        async with pool.agent():
+            with pytest.raises(HTTPException) as exc_info:
+                async with pool.agent():
+                    pass
+
+        assert exc_info.value.status_code == 503
+        assert pool.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_agents_checked_out_before_it(self):
+        """Test that agents from a cleared pool are not returned to the new one"""
+        pool = AgentPool(_fake_agent, size=1)
+
+        async with pool.agent() as old_agent:
+            pool.clear()
+
+        async with pool.agent() as new_agent:
+            assert new_agent is not old_agent
+        assert pool.queue.qsize() == 1
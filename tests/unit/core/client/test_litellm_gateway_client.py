@@ -9,15 +9,18 @@ import pytest
 import json
 import sys
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock, Mock
 from typing import Dict, Any
 
 # Add the source directory to the path so we can import the modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
 
-from agentic_platform.core.client.llm_gateway.litellm_gateway_client import LiteLLMGatewayClient
+from agentic_platform.core.client.llm_gateway.litellm_gateway_client import LiteLLMGatewayClient, RETRY_POLICY
 from agentic_platform.core.models.llm_models import LLMRequest, LLMResponse, Usage
-from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedResponse
+from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedBatchRequest, EmbedResponse
 from agentic_platform.core.models.memory_models import Message, TextContent
 
 
@@ -147,7 +150,7 @@ class TestLiteLLMGatewayClient:
     
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.to_llm_response')
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMRequestConverter.convert_llm_request')
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_chat_invoke_success(self, mock_post, mock_convert_request, mock_convert_response):
         """Test successful chat completion request"""
         # Mock converter methods
@@ -167,7 +170,8 @@ class TestLiteLLMGatewayClient:
         mock_post.assert_called_once_with(
             "http://localhost:4000/v1/chat/completions",
             headers=self.client._get_headers(),
-            json={"model": "test-model", "messages": []}
+            data=b'{"model":"test-model","messages":[]}',
+            stream=True
         )
         
         # Verify converters were called
@@ -178,13 +182,13 @@ class TestLiteLLMGatewayClient:
         assert isinstance(response, LLMResponse)
         assert response.id == "test-123"
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_chat_invoke_http_error(self, mock_post):
         """Test chat completion request with HTTP error"""
         # Mock error response
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.text = "Bad Request"
+        mock_response.iter_content.return_value = iter([b"Bad Request"])
         mock_post.return_value = mock_response
         
         # Make request and expect exception
@@ -194,17 +198,16 @@ class TestLiteLLMGatewayClient:
         assert "LiteLLM API error: 400 - Bad Request" in str(exc_info.value)
     
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.process_streaming_chunk')
-    @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.parse_streaming_line')
+    @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.parse_streaming_data')
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMRequestConverter.convert_llm_request')
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_chat_invoke_stream_success(self, mock_post, mock_convert_request, mock_parse_line, mock_process_chunk):
         """Test successful streaming chat completion request"""
         # Mock converter methods
         mock_convert_request.return_value = {"model": "test-model", "messages": []}
         mock_parse_line.side_effect = [
             {"id": "test-123", "choices": [{"delta": {"content": "Hello"}}]},
-            {"id": "test-123", "choices": [{"delta": {"content": " world"}}]},
-            {"done": True}
+            {"id": "test-123", "choices": [{"delta": {"content": " world"}}]}
         ]
         mock_process_chunk.side_effect = [
             LLMResponse(id="test-123", text="Hello"),
@@ -212,15 +215,17 @@ class TestLiteLLMGatewayClient:
         ]
         
         # Mock streaming HTTP response
+        # Raw chunks split mid-event, as a proxy may deliver them
         streaming_data = [
-            b'data: {"id":"test-123","choices":[{"delta":{"content":"Hello"}}]}',
-            b'data: {"id":"test-123","choices":[{"delta":{"content":" world"}}]}',
-            b'data: [DONE]'
+            b'data: {"id":"test-123","choices":[{"delta":{"content":"Hello"}}]}\n\ndata: {"id":"test-',
+            b'123","choices":[{"delta":{"content":" world"}}]}\n\n',
+            b'data: [DONE]\n\n',
+            b'data: {"trailing": "ignored"}\n\n'
         ]
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.iter_lines.return_value = streaming_data
+        mock_response.iter_content.return_value = iter(streaming_data)
         mock_post.return_value = mock_response
         
         # Make streaming request
@@ -229,12 +234,13 @@ class TestLiteLLMGatewayClient:
         # Verify HTTP request was made with streaming enabled
         mock_post.assert_called_once()
         call_args = mock_post.call_args
-        assert call_args[1]['json']['stream'] is True
+        assert json.loads(call_args[1]['data'])['stream'] is True
         assert call_args[1]['stream'] is True
         
         # Verify converters were called
         mock_convert_request.assert_called_once()
-        assert mock_parse_line.call_count == 3  # All 3 lines are parsed, but [DONE] is filtered out
+        assert mock_parse_line.call_count == 2  # [DONE] ends the stream without being parsed
+        assert mock_parse_line.call_args_list[1].args[0] == b'{"id":"test-123","choices":[{"delta":{"content":" world"}}]}'
         assert mock_process_chunk.call_count == 2  # Only 2 valid chunks processed
         
         # Verify responses
@@ -242,14 +248,15 @@ class TestLiteLLMGatewayClient:
         assert responses[0].text == "Hello"
         assert responses[1].text == "Hello world"
         assert responses[1].stop_reason == "stop"
+        mock_response.close.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_chat_invoke_stream_http_error(self, mock_post):
         """Test streaming request with HTTP error"""
         # Mock error response
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        mock_response.iter_content.return_value = iter([b"Internal Server Error"])
         mock_post.return_value = mock_response
         
         # Make request and expect exception
@@ -260,7 +267,7 @@ class TestLiteLLMGatewayClient:
     
     @pytest.mark.asyncio
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.process_streaming_chunk')
-    @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.parse_streaming_line')
+    @patch('agentic_platform.core.converter.litellm_converters.LiteLLMResponseConverter.parse_streaming_data')
     @patch('agentic_platform.core.converter.litellm_converters.LiteLLMRequestConverter.convert_llm_request')
     @patch('httpx.AsyncClient')
     async def test_chat_invoke_stream_async_success(self, mock_async_client, mock_convert_request, mock_parse_line, mock_process_chunk):
@@ -275,19 +282,19 @@ class TestLiteLLMGatewayClient:
         
         # Mock async streaming response
         streaming_data = [
-            'data: {"id":"test-123","choices":[{"delta":{"content":"Hello"}}]}',
-            'data: [DONE]'
+            b'data: {"id":"test-123","choices":[{"delta":{"content":"Hello"}}]}\n\n',
+            b'data: [DONE]\n\n'
         ]
         
         mock_response = Mock()
         mock_response.status_code = 200
         
-        # Create async iterator for aiter_lines
+        # Create async iterator for aiter_bytes
         async def async_iter():
-            for line in streaming_data:
-                yield line
+            for chunk in streaming_data:
+                yield chunk
         
-        mock_response.aiter_lines.return_value = async_iter()
+        mock_response.aiter_bytes.return_value = async_iter()
         
         # Create proper async context manager
         class AsyncContextManager:
@@ -299,16 +306,7 @@ class TestLiteLLMGatewayClient:
         
         mock_client_instance = Mock()
         mock_client_instance.stream.return_value = AsyncContextManager()
-        
-        # Create proper async context manager for the client
-        class ClientAsyncContextManager:
-            async def __aenter__(self):
-                return mock_client_instance
-            
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
-        
-        mock_async_client.return_value = ClientAsyncContextManager()
+        mock_async_client.return_value = mock_client_instance
         
         # Make async streaming request
         responses = []
@@ -319,8 +317,58 @@ class TestLiteLLMGatewayClient:
         assert len(responses) == 1
         assert responses[0].text == "Hello"
         assert responses[0].stop_reason == "stop"
+
+    @patch('requests.Session.post')
+    def test_error_body_is_capped(self, mock_post):
+        """Test that only the start of a large error body is read into the exception"""
+        mock_response = Mock()
+        mock_response.status_code = 502
+        mock_response.iter_content.return_value = iter([b"x" * 4096, b"never read"])
+        mock_post.return_value = mock_response
+        
+        with pytest.raises(Exception) as exc_info:
+            self.client.chat_invoke(self.sample_request)
+        
+        assert str(exc_info.value) == "LiteLLM API error: 502 - " + "x" * 2048
+        mock_response.close.assert_called_once()
+    
+    def test_retry_policy_does_not_repeat_completions(self):
+        """Test that only responses meaning the request never ran are retried"""
+        assert RETRY_POLICY.is_retry("POST", 429)
+        assert RETRY_POLICY.is_retry("POST", 503)
+        assert not RETRY_POLICY.is_retry("POST", 502)
+        assert not RETRY_POLICY.is_retry("POST", 504)
+        assert RETRY_POLICY.read == 0
+    
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_across_calls(self):
+        """Test that async streaming calls reuse one pooled client"""
+        first = self.client._get_async_client()
+        second = self.client._get_async_client()
+
+        assert first is second
+
+        await self.client.aclose()
+        assert len(self.client._async_clients) == 0
+        assert first.is_closed
+
+    def test_async_client_per_event_loop(self):
+        """Test that each event loop gets its own client and keeps reusing it"""
+        import asyncio
+
+        async def get_client_twice():
+            first = self.client._get_async_client()
+            assert self.client._get_async_client() is first
+            await self.client.aclose()
+            return first
+
+        loop_a_client = asyncio.run(get_client_twice())
+        loop_b_client = asyncio.run(get_client_twice())
+
+        assert loop_a_client is not loop_b_client
+        assert loop_a_client.is_closed and loop_b_client.is_closed
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_embed_invoke_success(self, mock_post):
         """Test successful embedding request"""
         # Mock successful embedding response
@@ -355,23 +403,57 @@ class TestLiteLLMGatewayClient:
         mock_post.assert_called_once_with(
             "http://localhost:4000/v1/embeddings",
             headers=self.client._get_headers(),
-            json={
+            data=json.dumps({
                 "model": "amazon.titan-embed-text-v2:0",
                 "input": "Hello world"
-            }
+            }, separators=(",", ":")).encode(),
+            stream=True
         )
         
         # Verify response
         assert isinstance(response, EmbedResponse)
         assert response.embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
+    def test_embed_invoke_batch_success(self, mock_post):
+        """Test that a batch of texts is embedded with one request, in input order"""
+        # Return the embeddings out of order to check they are sorted by index
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "embedding": [0.2], "index": 1},
+                {"object": "embedding", "embedding": [0.1], "index": 0}
+            ]
+        }
+        mock_post.return_value = mock_response
+        
+        batch_request = EmbedBatchRequest(
+            texts=["first", "second"],
+            model_id="amazon.titan-embed-text-v2:0"
+        )
+        
+        responses = self.client.embed_invoke_batch(batch_request)
+        
+        mock_post.assert_called_once_with(
+            "http://localhost:4000/v1/embeddings",
+            headers=self.client._get_headers(),
+            data=json.dumps({
+                "model": "amazon.titan-embed-text-v2:0",
+                "input": ["first", "second"]
+            }, separators=(",", ":")).encode(),
+            stream=True
+        )
+        assert [r.embedding for r in responses] == [[0.1], [0.2]]
+    
+    @patch('requests.Session.post')
     def test_embed_invoke_http_error(self, mock_post):
         """Test embedding request with HTTP error"""
         # Mock error response
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        mock_response.iter_content.return_value = iter([b"Internal Server Error"])
         mock_post.return_value = mock_response
         
         embed_request = EmbedRequest(
@@ -407,3 +489,95 @@ class TestLiteLLMGatewayClient:
         # Verify the configuration (OpenAI client adds trailing slash)
         assert str(openai_client.base_url) == "http://localhost:4000/v1/"
         assert openai_client.api_key == "test-key"
+
+
+class _ChunkedSSEHandler(BaseHTTPRequestHandler):
+    """Streams a short SSE completion ending in [DONE], as LiteLLM does, over keep-alive HTTP/1.1"""
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event in (b'data: {"id":"test-123","choices":[{"delta":{"content":"Hello"}}]}\n\n', b"data: [DONE]\n\n"):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+            self.wfile.flush()
+        # The chunked terminator arrives separately, after the client has seen [DONE]
+        time.sleep(0.05)
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLiteLLMGatewayClientConnectionReuse:
+    """Streams against a local server to check that finished streams return their connection to the pool"""
+
+    def setup_method(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChunkedSSEHandler)
+        self.server.connections = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.client = LiteLLMGatewayClient(api_key="test-key")
+        self.client.api_endpoint = f"http://127.0.0.1:{self.server.server_port}"
+        self.request = LLMRequest(
+            system_prompt="You are a helpful assistant.",
+            messages=[Message(role="user", content=[TextContent(type="text", text="Hi")])],
+            model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
+            hyperparams={}
+        )
+
+    def teardown_method(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync_streams_reuse_one_connection(self):
+        """Test that consecutive sync streams ending in [DONE] share one keep-alive connection"""
+        for _ in range(3):
+            responses = list(self.client.chat_invoke_stream(self.request))
+            assert responses[0].text == "Hello"
+
+        assert self.server.connections == 1
+
+    def test_async_streams_reuse_one_connection(self):
+        """Test that consecutive async streams ending in [DONE] share one keep-alive connection"""
+        import asyncio
+
+        async def stream_three_times():
+            for _ in range(3):
+                responses = [r async for r in self.client.chat_invoke_stream_async(self.request)]
+                assert responses[0].text == "Hello"
+            await self.client.aclose()
+
+        asyncio.run(stream_three_times())
+
+        assert self.server.connections == 1
+
+    def test_clients_of_closed_loops_are_released(self):
+        """Test that a client isn't kept alive for every loop that has come and gone"""
+        import asyncio
+        import gc
+        import weakref
+
+        clients = []
+
+        async def stream_once():
+            responses = [r async for r in self.client.chat_invoke_stream_async(self.request)]
+            assert responses[0].text == "Hello"
+            clients.append(weakref.ref(self.client._get_async_client()))
+
+        # Each run leaves a pooled connection open on a loop that then closes
+        for _ in range(5):
+            asyncio.run(stream_once())
+        gc.collect()
+
+        assert len(self.client._async_clients) == 1
+        assert sum(ref() is not None for ref in clients) == 1
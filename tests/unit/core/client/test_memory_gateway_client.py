@@ -0,0 +1,94 @@
+"""
+Unit tests for the Memory Gateway Client session cache.
+"""
+
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.core.client.memory_gateway.memory_gateway_client import MemoryGatewayClient
+from agentic_platform.core.models.memory_models import (
+    GetSessionContextRequest,
+    UpsertSessionContextRequest,
+    SessionContext,
+)
+
+CLIENT_MODULE = 'agentic_platform.core.client.memory_gateway.memory_gateway_client'
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+class TestMemoryGatewayClientSessionCache:
+    """Unit tests for the opt-in read-through session cache"""
+
+    def setup_method(self):
+        MemoryGatewayClient._session_cache = None
+        # The cache is opt-in; enable it for these tests
+        self._ttl_patch = patch(f'{CLIENT_MODULE}.SESSION_CACHE_TTL', 60)
+        self._ttl_patch.start()
+
+    def teardown_method(self):
+        self._ttl_patch.stop()
+
+    @patch(f'{CLIENT_MODULE}.get_auth_token', return_value='token-a')
+    @patch(f'{CLIENT_MODULE}.requests.post')
+    def test_cache_disabled_with_zero_ttl(self, mock_post, _):
+        """Test that every lookup hits the gateway when the cache is off"""
+        session = SessionContext(session_id='s1', user_id='u1')
+        mock_post.return_value = _response({'results': [session.model_dump(mode='json')]})
+
+        with patch(f'{CLIENT_MODULE}.SESSION_CACHE_TTL', 0):
+            MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+            MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+
+        assert mock_post.call_count == 2
+        # The cache, and cachetools with it, is never loaded while disabled
+        assert MemoryGatewayClient._session_cache is None
+
+    @patch(f'{CLIENT_MODULE}.get_auth_token', return_value='token-a')
+    @patch(f'{CLIENT_MODULE}.requests.post')
+    def test_repeated_lookup_served_from_cache(self, mock_post, _):
+        """Test that a second lookup for the same session skips the gateway"""
+        session = SessionContext(session_id='s1', user_id='u1')
+        mock_post.return_value = _response({'results': [session.model_dump(mode='json')]})
+
+        first = MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+        second = MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+
+        assert mock_post.call_count == 1
+        assert second.results[0].session_id == 's1'
+        # Callers get independent copies
+        assert second is not first
+
+    @patch(f'{CLIENT_MODULE}.requests.post')
+    def test_cache_is_scoped_to_auth_token(self, mock_post):
+        """Test that a cached session is not served to a different caller"""
+        session = SessionContext(session_id='s1', user_id='u1')
+        mock_post.return_value = _response({'results': [session.model_dump(mode='json')]})
+
+        with patch(f'{CLIENT_MODULE}.get_auth_token', return_value='token-a'):
+            MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+        with patch(f'{CLIENT_MODULE}.get_auth_token', return_value='token-b'):
+            MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+
+        assert mock_post.call_count == 2
+
+    @patch(f'{CLIENT_MODULE}.get_auth_token', return_value='token-a')
+    @patch(f'{CLIENT_MODULE}.requests.post')
+    def test_upsert_refreshes_cached_session(self, mock_post, _):
+        """Test that an upsert writes through so the next read sees it without a round trip"""
+        session = SessionContext(session_id='s1', user_id='u1', agent_id='updated')
+        mock_post.return_value = _response({'session_context': session.model_dump(mode='json')})
+
+        MemoryGatewayClient.upsert_session_context(UpsertSessionContextRequest(session_context=session))
+        result = MemoryGatewayClient.get_session_context(GetSessionContextRequest(session_id='s1'))
+
+        assert mock_post.call_count == 1
+        assert result.results[0].agent_id == 'updated'
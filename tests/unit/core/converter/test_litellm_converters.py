@@ -302,6 +302,15 @@ class TestLiteLLMResponseConverter:
         }
         assert result == expected
     
+    def test_parse_streaming_line_bytes(self):
+        """Test parsing a raw bytes streaming line"""
+        line = b'data: {"id": "chatcmpl-123", "choices": []}'
+        
+        result = LiteLLMResponseConverter.parse_streaming_line(line)
+        
+        assert result == {"id": "chatcmpl-123", "choices": []}
+        assert LiteLLMResponseConverter.parse_streaming_line(b'data: [DONE]') == {"done": True}
+    
     def test_parse_streaming_line_done_marker(self):
         """Test parsing the [DONE] marker"""
         line = 'data: [DONE]'
@@ -0,0 +1,27 @@
+import os
+import sys
+import pytest
+from pydantic import ValidationError
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.core.models.embedding_models import EmbedRequest, EmbedBatchRequest
+
+
+class TestEmbedRequestModelId:
+    """Test that embedding requests only accept supported models"""
+
+    def test_supported_model_accepted(self):
+        """Test that both request types accept a supported model"""
+        assert EmbedRequest(text="hi", model_id="amazon.titan-embed-text-v2:0").model_id == "amazon.titan-embed-text-v2:0"
+        assert EmbedBatchRequest(texts=["hi"], model_id="amazon.titan-embed-text-v2:0").model_id == "amazon.titan-embed-text-v2:0"
+
+    @pytest.mark.parametrize("request_cls, fields", [
+        (EmbedRequest, {"text": "hi"}),
+        (EmbedBatchRequest, {"texts": ["hi"]}),
+    ])
+    def test_unsupported_model_rejected(self, request_cls, fields):
+        """Test that both request types reject an unsupported model"""
+        with pytest.raises(ValidationError, match="Model ID unknown-model is not supported"):
+            request_cls(model_id="unknown-model", **fields)
@@ -0,0 +1,58 @@
+"""
+Unit tests for the SSEDecoder.
+
+This module contains unit tests for framing raw Server-Sent Events bytes
+into complete event data payloads.
+"""
+
+import sys
+import os
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.core.streaming.sse_decoder import SSEDecoder
+
+
+class TestSSEDecoder:
+    """Unit tests for SSEDecoder"""
+
+    def test_complete_events(self):
+        """Test that each blank-line terminated event yields its data"""
+        decoder = SSEDecoder()
+
+        events = decoder.feed(b'data: {"a":1}\n\ndata: [DONE]\n\n')
+
+        assert events == [b'{"a":1}', b'[DONE]']
+
+    def test_event_split_across_chunks(self):
+        """Test that a payload split mid-JSON is only emitted once complete"""
+        decoder = SSEDecoder()
+
+        assert decoder.feed(b'data: {"text": "hel') == []
+        assert decoder.feed(b'lo"}\n') == []
+        assert decoder.feed(b'\n') == [b'{"text": "hello"}']
+
+    def test_crlf_and_non_data_fields(self):
+        """Test CRLF line endings, comments and other fields are handled"""
+        decoder = SSEDecoder()
+
+        events = decoder.feed(b': keep-alive\r\nevent: chunk\r\ndata:{"a":1}\r\n\r\n')
+
+        assert events == [b'{"a":1}']
+
+    def test_multiline_data_joined(self):
+        """Test that multiple data lines in one event are joined with newlines"""
+        decoder = SSEDecoder()
+
+        events = decoder.feed(b'data: first\ndata: second\n\n')
+
+        assert events == [b'first\nsecond']
+
+    def test_finish_flushes_unterminated_event(self):
+        """Test that an event cut off by the end of the stream is still delivered"""
+        decoder = SSEDecoder()
+
+        assert decoder.feed(b'data: [DONE]') == []
+        assert decoder.finish() == [b'[DONE]']
+        assert decoder.finish() == []
@@ -0,0 +1,105 @@
+"""
+Unit tests for the BatchingStreamBuffer.
+
+This module contains unit tests for coalescing async stream items into
+size- and time-bounded batches.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add the source directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../', 'src'))
+
+from agentic_platform.core.streaming.stream_batcher import BatchingStreamBuffer
+
+
+async def _source(items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def _collect(buffer):
+    return [batch async for batch in buffer]
+
+
+class TestBatchingStreamBuffer:
+    """Unit tests for BatchingStreamBuffer"""
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_items(self):
+        """Test that a fast source is split into batches of at most max_items"""
+        batches = await _collect(BatchingStreamBuffer(_source(range(10)), max_items=4, max_delay_ms=1000))
+
+        assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_delay(self):
+        """Test that a slow source is flushed once the delay elapses"""
+        batches = await _collect(BatchingStreamBuffer(_source(range(3), delay=0.05), max_items=8, max_delay_ms=10))
+
+        assert batches == [[0], [1], [2]]
+
+    @pytest.mark.asyncio
+    async def test_empty_source(self):
+        """Test that an empty source produces no batches"""
+        batches = await _collect(BatchingStreamBuffer(_source([])))
+
+        assert batches == []
+
+    @pytest.mark.asyncio
+    async def test_source_error_is_raised_after_flush(self):
+        """Test that items before a failure are flushed and the error propagates"""
+        async def failing_source():
+            yield 1
+            yield 2
+            raise RuntimeError("boom")
+
+        received = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for batch in BatchingStreamBuffer(failing_source(), max_items=8, max_delay_ms=1000):
+                received.extend(batch)
+
+        assert received == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_disconnect_closes_source(self):
+        """Test that cancelling a consumer while the queue is full stops the pump and closes the source"""
+        source_closed = asyncio.Event()
+        first_batch = asyncio.Event()
+
+        async def endless_source():
+            try:
+                while True:
+                    yield 1
+            finally:
+                source_closed.set()
+
+        buffer = BatchingStreamBuffer(endless_source(), max_items=2, max_delay_ms=1000)
+
+        async def slow_consumer():
+            stream = buffer.__aiter__()
+            try:
+                async for _ in stream:
+                    first_batch.set()
+                    await asyncio.Event().wait()
+            finally:
+                await stream.aclose()
+
+        task = asyncio.create_task(slow_consumer())
+        await first_batch.wait()
+        # Let the pump fill the queue and block on put
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert source_closed.is_set()
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert pending == []